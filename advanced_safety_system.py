@@ -1,11 +1,12 @@
 # python advanced_safety_system.py --webcam webcam_index
 
-from scipy.spatial import distance as dist
 from imutils.video import VideoStream
 from imutils import face_utils
 import numpy as np
 import argparse
-import imutils
+import math
+import threading
+import queue
 import time
 import dlib
 import cv2
@@ -20,6 +21,18 @@ import string
 import speech_recognition as sr
 from adxl345 import ADXL345
 
+try:
+    import pynmea2
+except ImportError:
+    print("Warning: pynmea2 not found. Falling back to manual NMEA parsing.")
+    pynmea2 = None
+
+try:
+    from numba import njit
+except ImportError:
+    print("Warning: numba not found. Running EAR/MAR kernels in pure Python.")
+    njit = None
+
 # -------------------------
 # CONFIGURATION - EDIT THESE
 # -------------------------
@@ -30,6 +43,9 @@ EMAIL_RECIPIENT = "emergency_contact@gmail.com"  # Emergency contact email
 BUZZER_PIN = 18
 ALCOHOL_SENSOR_CHANNEL = 0  # MCP3008 channel for MQ sensor
 ALCOHOL_THRESHOLD = 500  # Adjust based on your sensor calibration
+# MCP3008.value is already the 0-1 ratio; precompute the threshold on
+# that scale so polling skips the per-read ADC conversion
+ALCOHOL_THRESH_RATIO = ALCOHOL_THRESHOLD / 1024.0
 TILT_THRESHOLD = 45  # degrees
 
 GPS_SERIAL_PORT = "/dev/ttyAMA0"  # or /dev/serial0 for Pi 5
@@ -120,29 +136,33 @@ def deactivate_external_buzzer():
 # -------------------------
 # EAR & MAR calculations
 # -------------------------
+# Landmark index ranges, hoisted out of the per-frame path
+(L_START, L_END) = face_utils.FACIAL_LANDMARKS_IDXS["left_eye"]
+(R_START, R_END) = face_utils.FACIAL_LANDMARKS_IDXS["right_eye"]
+MOUTH_SLICE = slice(48, 60)  # outer lips
+
+# The EAR/MAR/tilt math is a handful of floats per call but runs every
+# frame, so the kernels are written in scalar form and JIT-compiled with
+# numba when available; the plain-Python versions remain correct fallbacks.
 def eye_aspect_ratio(eye):
-    A = dist.euclidean(eye[1], eye[5])
-    B = dist.euclidean(eye[2], eye[4])
-    C = dist.euclidean(eye[0], eye[3])
-    return (A + B) / (2.0 * C)
-
-def final_ear(shape):
-    (lStart, lEnd) = face_utils.FACIAL_LANDMARKS_IDXS["left_eye"]
-    (rStart, rEnd) = face_utils.FACIAL_LANDMARKS_IDXS["right_eye"]
-    leftEye = shape[lStart:lEnd]
-    rightEye = shape[rStart:rEnd]
-    leftEAR = eye_aspect_ratio(leftEye)
-    rightEAR = eye_aspect_ratio(rightEye)
-    ear = (leftEAR + rightEAR) / 2.0
-    return ear, leftEye, rightEye
-
-def mouth_aspect_ratio(shape):
-    mouth = shape[48:60]  # outer lips
-    A = dist.euclidean(mouth[2], mouth[10])
-    B = dist.euclidean(mouth[4], mouth[8])
-    C = dist.euclidean(mouth[0], mouth[6])
-    mar = (A + B) / (2.0 * C)
-    return mar
+    a = ((eye[1, 0] - eye[5, 0])**2 + (eye[1, 1] - eye[5, 1])**2) ** 0.5
+    b = ((eye[2, 0] - eye[4, 0])**2 + (eye[2, 1] - eye[4, 1])**2) ** 0.5
+    c = ((eye[0, 0] - eye[3, 0])**2 + (eye[0, 1] - eye[3, 1])**2) ** 0.5
+    return (a + b) / (2.0 * c)
+
+def _mar_kernel(mouth):
+    a = ((mouth[2, 0] - mouth[10, 0])**2 + (mouth[2, 1] - mouth[10, 1])**2) ** 0.5
+    b = ((mouth[4, 0] - mouth[8, 0])**2 + (mouth[4, 1] - mouth[8, 1])**2) ** 0.5
+    c = ((mouth[0, 0] - mouth[6, 0])**2 + (mouth[0, 1] - mouth[6, 1])**2) ** 0.5
+    return (a + b) / (2.0 * c)
+
+def _tilt_angle(x, y, z):
+    return np.degrees(np.arccos(z / np.sqrt(x * x + y * y + z * z)))
+
+if njit is not None:
+    eye_aspect_ratio = njit(cache=True, fastmath=True)(eye_aspect_ratio)
+    _mar_kernel = njit(cache=True, fastmath=True)(_mar_kernel)
+    _tilt_angle = njit(cache=True, fastmath=True)(_tilt_angle)
 
 # -------------------------
 # Alcohol detection
@@ -151,14 +171,13 @@ def check_alcohol_level():
     if alcohol_sensor is None:
         return False
     try:
-        reading = alcohol_sensor.value * 1024  # Convert to ADC value
-        return reading > ALCOHOL_THRESHOLD
+        return alcohol_sensor.value > ALCOHOL_THRESH_RATIO
     except:
         return False
 
 def generate_random_text():
     """Generate random text for sobriety test"""
-    words = ['apple', 'banana', 'computer', 'elephant', 'freedom', 
+    words = ['apple', 'banana', 'computer', 'elephant', 'freedom',
              'guitar', 'hospital', 'internet', 'jacket', 'kitchen']
     return ' '.join(random.sample(words, 4))
 
@@ -169,18 +188,18 @@ def verify_speech(expected_text):
             print("🎤 Listening... Speak now!")
             recognizer.adjust_for_ambient_noise(source, duration=1)
             audio = recognizer.listen(source, timeout=10, phrase_time_limit=15)
-            
+
             spoken_text = recognizer.recognize_google(audio).lower()
             expected_lower = expected_text.lower()
-            
+
             print(f"Expected: {expected_lower}")
             print(f"Heard: {spoken_text}")
-            
+
             # Check similarity (allow some flexibility)
             words_expected = set(expected_lower.split())
             words_spoken = set(spoken_text.split())
             match_ratio = len(words_expected & words_spoken) / len(words_expected)
-            
+
             return match_ratio >= 0.75  # 75% match required
     except sr.WaitTimeoutError:
         print("⚠️ Timeout - No speech detected")
@@ -195,24 +214,28 @@ def verify_speech(expected_text):
 # -------------------------
 # Accelerometer - Tilt detection
 # -------------------------
-def check_tilt_angle():
-    """Check if vehicle has tilted beyond threshold"""
+# arccos is monotonic decreasing, so "angle > TILT_THRESHOLD" can be
+# tested as z^2 < cos^2(threshold) * |v|^2 with no sqrt or trig on the
+# 50 Hz poll path; degrees are only computed where they are displayed.
+COS2_TILT_THRESH = math.cos(math.radians(TILT_THRESHOLD)) ** 2
+
+def check_tilt():
+    """Check if vehicle has tilted beyond threshold.
+    Returns (is_tilted, (x, y, z)); use _tilt_angle for degrees."""
     if accelerometer is None:
-        return False, 0
-    
+        return False, (0.0, 0.0, 1.0)
+
     try:
         axes = accelerometer.get_axes(True)  # Get g-force values
         x, y, z = axes['x'], axes['y'], axes['z']
-        
-        # Calculate tilt angle from vertical (z-axis)
-        # When upright, z ≈ 1g, x ≈ 0, y ≈ 0
-        tilt_angle = np.degrees(np.arccos(z / np.sqrt(x**2 + y**2 + z**2)))
-        
-        is_tilted = tilt_angle > TILT_THRESHOLD
-        return is_tilted, tilt_angle
+
+        # When upright, z ≈ 1g, x ≈ 0, y ≈ 0; z <= 0 means past 90°
+        mag2 = x * x + y * y + z * z
+        is_tilted = z <= 0.0 or z * z < COS2_TILT_THRESH * mag2
+        return is_tilted, (x, y, z)
     except Exception as e:
         print(f"⚠️ Tilt detection error: {e}")
-        return False, 0
+        return False, (0.0, 0.0, 1.0)
 
 # -------------------------
 # GPS - Location tracking
@@ -220,51 +243,99 @@ def check_tilt_angle():
 def parse_gps_data():
     """Parse NMEA sentences from GPS module"""
     global last_gps_coords
-    
+
     if gps_serial is None:
         return last_gps_coords
-    
+
     try:
         for _ in range(10):  # Try reading multiple lines
             line = gps_serial.readline().decode('ascii', errors='replace')
-            
+
             if line.startswith('$GPGGA') or line.startswith('$GNGGA'):
                 parts = line.split(',')
                 if len(parts) > 6 and parts[2] and parts[4]:
-                    # Parse latitude
-                    lat_raw = parts[2]
-                    lat_deg = float(lat_raw[:2])
-                    lat_min = float(lat_raw[2:])
-                    lat = lat_deg + lat_min / 60
+                    # NMEA ddmm.mmmm -> decimal degrees with a single float
+                    # parse per coordinate instead of two slice parses
+                    v = float(parts[2])
+                    lat_deg = int(v // 100)
+                    lat = lat_deg + (v - lat_deg * 100) / 60.0
                     if parts[3] == 'S':
                         lat = -lat
-                    
-                    # Parse longitude
-                    lon_raw = parts[4]
-                    lon_deg = float(lon_raw[:3])
-                    lon_min = float(lon_raw[3:])
-                    lon = lon_deg + lon_min / 60
+
+                    v = float(parts[4])
+                    lon_deg = int(v // 100)
+                    lon = lon_deg + (v - lon_deg * 100) / 60.0
                     if parts[5] == 'W':
                         lon = -lon
-                    
+
                     last_gps_coords = {"lat": lat, "lon": lon}
                     return last_gps_coords
     except Exception as e:
         print(f"⚠️ GPS parsing error: {e}")
-    
+
     return last_gps_coords
 
 # -------------------------
 # Email alert system
 # -------------------------
+class EmailSender:
+    """Background email worker with a persistent SMTP connection.
+
+    Gmail's STARTTLS + login handshake takes hundreds of milliseconds,
+    so alerts are queued and delivered from a daemon thread; the
+    connection is kept alive between alerts and rebuilt on failure."""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.smtp = None
+        self.thread = threading.Thread(target=self._worker, daemon=True)
+        self.thread.start()
+
+    def send(self, msg, incident_type):
+        """Queue a message for delivery (non-blocking)"""
+        self.queue.put((msg, incident_type))
+
+    def _deliver(self, msg):
+        if self.smtp is None:
+            self.smtp = smtplib.SMTP('smtp.gmail.com', 587)
+            self.smtp.starttls()
+            self.smtp.login(EMAIL_SENDER, EMAIL_PASSWORD)
+        self.smtp.send_message(msg)
+
+    def _reset(self):
+        if self.smtp is not None:
+            try:
+                self.smtp.quit()
+            except Exception:
+                pass
+            self.smtp = None
+
+    def _worker(self):
+        while True:
+            msg, incident_type = self.queue.get()
+            try:
+                self._deliver(msg)
+            except Exception:
+                # Connection likely went stale - rebuild it and retry once
+                self._reset()
+                try:
+                    self._deliver(msg)
+                except Exception as e:
+                    print(f"⚠️ Email send error: {e}")
+                    self._reset()
+                    continue
+            print(f"✓ Emergency email sent: {incident_type}")
+
+email_sender = EmailSender()
+
 def send_emergency_email(incident_type, gps_coords):
-    """Send emergency email with GPS coordinates"""
+    """Queue an emergency email with GPS coordinates (non-blocking)"""
     try:
         msg = MIMEMultipart()
         msg['From'] = EMAIL_SENDER
         msg['To'] = EMAIL_RECIPIENT
         msg['Subject'] = f"🚨 EMERGENCY ALERT - {incident_type}"
-        
+
         body = f"""
 EMERGENCY ALERT - DRIVER SAFETY SYSTEM
 
@@ -284,17 +355,9 @@ Please check on the driver immediately.
 ---
 Driver Safety Monitoring System
         """
-        
+
         msg.attach(MIMEText(body, 'plain'))
-        
-        server = smtplib.SMTP('smtp.gmail.com', 587)
-        server.starttls()
-        server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-        text = msg.as_string()
-        server.sendmail(EMAIL_SENDER, EMAIL_RECIPIENT, text)
-        server.quit()
-        
-        print(f"✓ Emergency email sent: {incident_type}")
+        email_sender.send(msg, incident_type)
         return True
     except Exception as e:
         print(f"⚠️ Email send error: {e}")
@@ -316,11 +379,292 @@ COUNTER = 0
 
 MAR_MULTIPLIER = 1.7
 MAR_SMOOTH_WIN = 10
-lip_hist = []
+# Preallocated ring buffer for MAR smoothing. np.add.reduce over the
+# 10-element float32 buffer skips np.mean's dispatch overhead and,
+# unlike an incrementally maintained sum, cannot drift over long runs.
+lip_hist = np.zeros(MAR_SMOOTH_WIN, dtype=np.float32)
+lip_idx = 0
+lip_n = 0
+_reduce = np.add.reduce
 calib_base = None
+calib_sum = 0.0
 CALIB_FRAMES = 30
 calib_count = 0
 
+# -------------------------
+# Capture / detection pipeline
+# -------------------------
+# Three-thread pipeline: the capture thread owns the camera (OpenCV capture
+# is not thread-safe), the detection thread runs dlib (slow on the Pi), and
+# the main thread handles sensors, alerts and display. Bounded queues with
+# drop-oldest keep latency low when the detector falls behind the camera.
+FRAME_QUEUE_SIZE = 2
+
+# dlib's HOG detector only finds faces >= ~80x80 px; at driver-seat
+# distance the face fills far more of the frame, so scanning at half
+# resolution loses nothing but cuts the pyramid work ~4x.
+DETECT_SCALE = 2
+
+# Detect-then-track: once a face is found, a correlation tracker follows
+# it for a fraction of the detector's cost; the full HOG scan only reruns
+# periodically or when tracking is lost.
+REDETECT_INTERVAL = 15   # frames between full detector passes
+TRACK_ROI_SCALE = 1.5    # ROI padding around the tracked box on re-detect
+
+def create_tracker():
+    """Create the cheapest available OpenCV tracker (MOSSE, else KCF)"""
+    try:
+        return cv2.legacy.TrackerMOSSE_create()
+    except AttributeError:
+        try:
+            return cv2.TrackerKCF_create()
+        except AttributeError:
+            return None
+
+frame_queue = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+result_queue = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+stop_event = threading.Event()
+
+def queue_put_latest(q, item):
+    """Put item on a bounded queue, discarding the oldest entry if full"""
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            pass
+
+def capture_loop(vs):
+    """Capture thread: read frames from the camera as fast as it delivers them"""
+    while not stop_event.is_set():
+        frame = vs.read()
+        if frame is None:
+            time.sleep(0.01)
+            continue
+        queue_put_latest(frame_queue, frame)
+
+def detect_faces(small, roi=None):
+    """Run the HOG detector, optionally restricted to a region of interest.
+    Returns rects in small-frame coordinates."""
+    if roi is not None:
+        x0, y0, x1, y1 = roi
+        found = detector(small[y0:y1, x0:x1], 0)
+        return [dlib.rectangle(r.left() + x0, r.top() + y0,
+                               r.right() + x0, r.bottom() + y0)
+                for r in found]
+    return list(detector(small, 0))
+
+def detection_loop():
+    """Detection thread: dlib face detection + landmarks, EAR/MAR analysis.
+    This thread is the only one that touches COUNTER, lip_hist and the
+    MAR calibration state."""
+    global COUNTER, calib_base, calib_sum, calib_count
+    global lip_idx, lip_n
+
+    tracker = None
+    last_bbox = None
+    frames_since_detect = 0
+    resize_to = None  # computed once - camera resolution is fixed per session
+
+    while not stop_event.is_set():
+        try:
+            frame = frame_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+        if resize_to is None:
+            h, w = frame.shape[:2]
+            resize_to = (640, int(640 * h / w)) if w != 640 else False
+        if resize_to:
+            frame = cv2.resize(frame, resize_to, interpolation=cv2.INTER_LINEAR)
+
+        # Detect on a downscaled copy, then scale the rects back up and run
+        # the landmark predictor on the full-resolution gray for precision.
+        # Downscale before converting so cvtColor touches 1/4 of the pixels;
+        # the full-resolution gray is only produced when a face needs
+        # landmarks, so face-free frames skip the conversion entirely.
+        small = cv2.cvtColor(cv2.resize(frame, (frame.shape[1] // DETECT_SCALE,
+                                                frame.shape[0] // DETECT_SCALE)),
+                             cv2.COLOR_BGR2GRAY)
+
+        small_rects = []
+        need_detect = tracker is None or frames_since_detect >= REDETECT_INTERVAL
+        if not need_detect:
+            ok, bbox = tracker.update(small)
+            if ok:
+                x, y, w, h = (int(v) for v in bbox)
+                small_rects = [dlib.rectangle(x, y, x + w, y + h)]
+                last_bbox = (x, y, w, h)
+                frames_since_detect += 1
+            else:
+                need_detect = True
+
+        if need_detect:
+            roi = None
+            if last_bbox is not None:
+                # Re-detect inside a padded ROI around the last known face
+                x, y, w, h = last_bbox
+                pad_w = int(w * (TRACK_ROI_SCALE - 1) / 2)
+                pad_h = int(h * (TRACK_ROI_SCALE - 1) / 2)
+                roi = (max(0, x - pad_w), max(0, y - pad_h),
+                       min(small.shape[1], x + w + pad_w),
+                       min(small.shape[0], y + h + pad_h))
+            small_rects = detect_faces(small, roi)
+            if not small_rects and roi is not None:
+                # Face left the ROI - fall back to a full-frame scan
+                small_rects = detect_faces(small)
+            frames_since_detect = 0
+            tracker = None
+            last_bbox = None
+            if small_rects:
+                r = small_rects[0]
+                last_bbox = (r.left(), r.top(), r.width(), r.height())
+                tracker = create_tracker()
+                if tracker is not None:
+                    tracker.init(small, last_bbox)
+
+        rects = [dlib.rectangle(r.left() * DETECT_SCALE,
+                                r.top() * DETECT_SCALE,
+                                r.right() * DETECT_SCALE,
+                                r.bottom() * DETECT_SCALE)
+                 for r in small_rects]
+        trigger_alert = False
+        ear = 0.0
+        smooth_mar = 0.0
+
+        if len(rects) == 0:
+            cv2.putText(frame, "No face detected - Look at camera", (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,165,255), 2)
+            COUNTER = 0
+        else:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            for rect in rects:
+                shape = predictor(gray, rect)
+                # One int->float32 conversion per face; the kernels then
+                # operate on contiguous typed subarrays with no per-call
+                # dtype promotion
+                pts = face_utils.shape_to_np(shape).astype(np.float32)
+                ear = 0.5 * (eye_aspect_ratio(pts[L_START:L_END]) +
+                             eye_aspect_ratio(pts[R_START:R_END]))
+                mar = _mar_kernel(pts[MOUTH_SLICE])
+
+                # Smooth MAR (unfilled slots are zero, so the reduction
+                # over the whole buffer divided by lip_n stays correct
+                # during warm-up)
+                lip_hist[lip_idx] = mar
+                lip_idx = (lip_idx + 1) % MAR_SMOOTH_WIN
+                lip_n = min(lip_n + 1, MAR_SMOOTH_WIN)
+                smooth_mar = float(_reduce(lip_hist)) / lip_n
+
+                # Calibrate neutral MAR with a true running mean, frozen
+                # after CALIB_FRAMES. The old (base + x)/2 update was a
+                # geometric decay that all but forgot the early frames.
+                if calib_count < CALIB_FRAMES:
+                    calib_sum += smooth_mar
+                    calib_count += 1
+                    calib_base = calib_sum / calib_count
+                    cv2.putText(frame, "Calibrating mouth...", (10,60),
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0,255,255),2)
+                else:
+                    if smooth_mar > calib_base * MAR_MULTIPLIER:
+                        trigger_alert = True
+                        cv2.putText(frame, "YAWN DETECTED", (10,90),
+                                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0,255,255), 2)
+
+                # Eye drowsiness
+                if ear < EYE_AR_THRESH:
+                    COUNTER += 1
+                    if COUNTER >= EYE_AR_CONSEC_FRAMES:
+                        trigger_alert = True
+                        cv2.putText(frame, "DROWSINESS ALERT!", (10,30),
+                                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0,0,255), 2)
+                else:
+                    COUNTER = 0
+
+        result = {
+            "frame": frame,
+            "ear": ear,
+            "mar": smooth_mar,
+            "trigger_alert": trigger_alert,
+            "face_found": len(rects) > 0,
+        }
+        queue_put_latest(result_queue, result)
+
+# -------------------------
+# Sensor polling threads
+# -------------------------
+# GPS readline() can block for up to a second and the I2C/SPI transactions
+# take milliseconds each, so none of it belongs on the vision path. Two
+# background threads poll the sensors at their natural rates and publish
+# the latest values behind a lock; the main loop just reads the cache.
+TILT_POLL_INTERVAL = 0.02     # 50 Hz - accident detection needs fast response
+ALCOHOL_POLL_INTERVAL = 0.1   # 10 Hz - MQ sensors respond slowly anyway
+GPS_POLL_INTERVAL = 1.0       # NEO-6M emits fixes at 1 Hz
+
+sensor_lock = threading.Lock()
+sensor_state = {
+    "tilt": (False, (0.0, 0.0, 1.0)),
+    "alcohol": False,
+    "gps": {"lat": None, "lon": None},
+}
+
+def gps_loop():
+    """GPS thread: stream NMEA off the serial port and cache the latest fix"""
+    if gps_serial is None:
+        return
+
+    if pynmea2 is None:
+        # Fallback: manual GGA parsing at the module's 1 Hz fix rate
+        while not stop_event.is_set():
+            coords = parse_gps_data()
+            with sensor_lock:
+                sensor_state["gps"] = coords
+            time.sleep(GPS_POLL_INTERVAL)
+        return
+
+    # Bulk-read whatever is buffered and let the stream reader deal with
+    # partial/concatenated sentences; only the freshest GGA fix is kept.
+    streamreader = pynmea2.NMEAStreamReader(errors='ignore')
+    while not stop_event.is_set():
+        try:
+            data = gps_serial.read(gps_serial.in_waiting or 1)
+        except Exception as e:
+            print(f"⚠️ GPS read error: {e}")
+            time.sleep(GPS_POLL_INTERVAL)
+            continue
+        if not data:
+            continue
+        try:
+            for msg in streamreader.next(data.decode('ascii', errors='replace')):
+                if isinstance(msg, pynmea2.types.talker.GGA) and msg.latitude:
+                    with sensor_lock:
+                        sensor_state["gps"] = {"lat": msg.latitude,
+                                               "lon": msg.longitude}
+        except pynmea2.ParseError:
+            pass
+
+def sensor_loop():
+    """Sensor thread: poll tilt at 50 Hz and the alcohol sensor at 10 Hz"""
+    next_alcohol = 0.0
+    while not stop_event.is_set():
+        tilt = check_tilt()
+        with sensor_lock:
+            sensor_state["tilt"] = tilt
+
+        now = time.monotonic()
+        if now >= next_alcohol:
+            alcohol = check_alcohol_level()
+            with sensor_lock:
+                sensor_state["alcohol"] = alcohol
+            next_alcohol = now + ALCOHOL_POLL_INTERVAL
+
+        time.sleep(TILT_POLL_INTERVAL)
+
 # -------------------------
 # Facial detection setup
 # -------------------------
@@ -337,45 +681,106 @@ print("  ✓ Emergency Email Alerts")
 print("="*60)
 print("-> Loading facial landmark predictor...")
 
+# A scalar dlib build is 2-4x slower on the Pi; see build_dlib_pi.sh
+neon_flag = getattr(dlib, 'USE_NEON_INSTRUCTIONS', 'unknown - see build_dlib_pi.sh')
+print(f"-> dlib {dlib.__version__} (NEON: {neon_flag})")
+
 detector = dlib.get_frontal_face_detector()
-predictor = dlib.shape_predictor("shape_predictor_68_face_landmarks.dat")
+
+# Prefer the small eyes+mouth predictor when available (see
+# train_subset_predictor.py): EAR/MAR only need 24 of the 68 landmarks
+# and predictor cost scales with landmark count. The subset model keeps
+# iBUG points 36-47 (eyes) and 48-59 (outer lips), which come out in
+# sorted order, so the index constants are remapped to match.
+SUBSET_PREDICTOR_PATH = "shape_predictor_eyes_mouth.dat"
+try:
+    predictor = dlib.shape_predictor(SUBSET_PREDICTOR_PATH)
+    R_START, R_END = 0, 6     # iBUG 36-41
+    L_START, L_END = 6, 12    # iBUG 42-47
+    MOUTH_SLICE = slice(12, 24)  # iBUG 48-59
+    print(f"✓ Using subset landmark predictor ({SUBSET_PREDICTOR_PATH})")
+except RuntimeError:
+    predictor = dlib.shape_predictor("shape_predictor_68_face_landmarks.dat")
 
 print("-> Starting Video Stream...")
 vs = VideoStream(src=args["webcam"]).start()
 time.sleep(2.0)
+
+capture_thread = threading.Thread(target=capture_loop, args=(vs,), daemon=True)
+detection_thread = threading.Thread(target=detection_loop, daemon=True)
+gps_thread = threading.Thread(target=gps_loop, daemon=True)
+sensor_thread = threading.Thread(target=sensor_loop, daemon=True)
+capture_thread.start()
+detection_thread.start()
+gps_thread.start()
+sensor_thread.start()
+
 print("✓ System Ready! Press 'q' to quit, 'a' to test alcohol sensor")
 print("="*60)
 
+# -------------------------
+# Static overlay cache
+# -------------------------
+# The HUD labels never change, but putText re-rasterizes glyphs on
+# every call. Render the static text once into a layer + mask and blit
+# it each frame; only the numeric values are drawn with putText.
+static_layer = None
+static_mask = None
+
+def build_static_overlay(shape):
+    global static_layer, static_mask
+    static_layer = np.zeros(shape, dtype=np.uint8)
+    cv2.putText(static_layer, "EAR:", (10, 470),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255,255,255), 2)
+    cv2.putText(static_layer, "MAR:", (150, 470),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255,255,255), 2)
+    cv2.putText(static_layer, "Tilt:", (290, 470),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255,255,255), 2)
+    static_mask = (static_layer.sum(axis=2) > 0)[..., None]
+
 # -------------------------
 # Main Loop
 # -------------------------
+UI_REFRESH_INTERVAL = 1.0 / 30  # the window doesn't need more than 30 Hz
+HAVE_POLLKEY = hasattr(cv2, 'pollKey')  # OpenCV >= 4.5
+
 drowsiness_email_sent = False
+last_result = None
+last_show = 0.0
 
 while True:
-    frame = vs.read()
-    if frame is None:
-        time.sleep(0.1)
+    # Pull the freshest detection result; if the worker hasn't produced a
+    # new one yet, keep showing the last annotated frame.
+    try:
+        last_result = result_queue.get(timeout=0.1)
+    except queue.Empty:
+        pass
+    if last_result is None:
         continue
 
-    frame = imutils.resize(frame, width=640)
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    frame = last_result["frame"].copy()
+    ear = last_result["ear"]
+    smooth_mar = last_result["mar"]
+    trigger_alert = last_result["trigger_alert"]
+    face_found = last_result["face_found"]
 
     # -------------------------
-    # Check sensors
+    # Check sensors (cached by the polling threads)
     # -------------------------
-    # GPS update (continuous)
-    gps_coords = parse_gps_data()
-    
-    # Tilt detection
-    is_tilted, tilt_angle = check_tilt_angle()
+    with sensor_lock:
+        is_tilted, tilt_axes = sensor_state["tilt"]
+        alcohol_detected = sensor_state["alcohol"]
+        gps_coords = sensor_state["gps"]
+    tilt_angle = _tilt_angle(*tilt_axes)
+
     if is_tilted and not accident_detected:
         accident_detected = True
         print(f"🚨 ACCIDENT DETECTED - Tilt: {tilt_angle:.1f}°")
         activate_external_buzzer()
         send_emergency_email(f"ACCIDENT - Vehicle Tilted {tilt_angle:.1f}°", gps_coords)
-    
+
     # Alcohol detection
-    if not alcohol_test_active and check_alcohol_level():
+    if not alcohol_test_active and alcohol_detected:
         alcohol_test_active = True
         test_text = generate_random_text()
         print(f"\n{'='*60}")
@@ -386,17 +791,9 @@ while True:
         print(f"{'='*60}\n")
 
     # -------------------------
-    # Face detection & analysis
+    # Alert Logic (Drowsiness/Yawn)
     # -------------------------
-    rects = detector(gray, 0)
-    trigger_alert = False
-    ear = 0.0
-    smooth_mar = 0.0
-
-    if len(rects) == 0:
-        cv2.putText(frame, "No face detected - Look at camera", (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0,165,255), 2)
-        COUNTER = 0
+    if not face_found:
         if not accident_detected and not alcohol_test_active:
             beep_start_time = None
             if alert_active:
@@ -404,46 +801,7 @@ while True:
                 alert_active = False
             if buzzer_active:
                 deactivate_external_buzzer()
-    else:
-        for rect in rects:
-            shape = predictor(gray, rect)
-            shape = face_utils.shape_to_np(shape)
-
-            ear, leftEye, rightEye = final_ear(shape)
-            mar = mouth_aspect_ratio(shape)
-
-            # Smooth MAR
-            lip_hist.append(mar)
-            if len(lip_hist) > MAR_SMOOTH_WIN:
-                lip_hist.pop(0)
-            smooth_mar = np.mean(lip_hist)
-
-            # Calibrate neutral MAR
-            if calib_count < CALIB_FRAMES:
-                calib_base = smooth_mar if calib_base is None else (calib_base + smooth_mar)/2
-                calib_count += 1
-                cv2.putText(frame, "Calibrating mouth...", (10,60),
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0,255,255),2)
-            else:
-                if smooth_mar > calib_base * MAR_MULTIPLIER:
-                    trigger_alert = True
-                    cv2.putText(frame, "YAWN DETECTED", (10,90),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0,255,255), 2)
-
-            # Eye drowsiness
-            if ear < EYE_AR_THRESH:
-                COUNTER += 1
-                if COUNTER >= EYE_AR_CONSEC_FRAMES:
-                    trigger_alert = True
-                    cv2.putText(frame, "DROWSINESS ALERT!", (10,30),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0,0,255), 2)
-            else:
-                COUNTER = 0
-
-    # -------------------------
-    # Alert Logic (Drowsiness/Yawn)
-    # -------------------------
-    if trigger_alert:
+    elif trigger_alert:
         if not alert_active:
             alert_active = True
             beep_start_time = time.time()
@@ -455,7 +813,7 @@ while True:
             if beep_start_time and (time.time() - beep_start_time >= BEEP_DURATION):
                 if not buzzer_active:
                     activate_external_buzzer()
-                
+
                 # Send email if driver didn't wake up
                 if not drowsiness_email_sent:
                     send_emergency_email("DROWSINESS - Driver Not Responding", gps_coords)
@@ -473,37 +831,42 @@ while True:
     # -------------------------
     # Display overlays
     # -------------------------
+    # Blit the pre-rendered static labels
+    if static_layer is None or static_layer.shape != frame.shape:
+        build_static_overlay(frame.shape)
+    np.copyto(frame, static_layer, where=static_mask)
+
     # Status indicator
     status_color = (0,255,0) if not alert_active else (0,0,255)
     status_text = "NORMAL" if not alert_active else "ALERT!"
     cv2.circle(frame, (610, 20), 10, status_color, -1)
     cv2.putText(frame, status_text, (530, 25),
                 cv2.FONT_HERSHEY_SIMPLEX, 0.6, status_color, 2)
-    
-    # Metrics
-    cv2.putText(frame, f"EAR: {ear:.2f}" if ear>0 else "EAR: N/A", (10, 470),
+
+    # Metrics (values only - the labels come from the static layer)
+    cv2.putText(frame, f"{ear:.2f}" if ear>0 else "N/A", (55, 470),
                 cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255,255,255), 2)
-    cv2.putText(frame, f"MAR: {smooth_mar:.2f}" if smooth_mar>0 else "MAR: N/A", (150, 470),
+    cv2.putText(frame, f"{smooth_mar:.2f}" if smooth_mar>0 else "N/A", (200, 470),
                 cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255,255,255), 2)
-    cv2.putText(frame, f"Tilt: {tilt_angle:.1f}°", (290, 470),
+    cv2.putText(frame, f"{tilt_angle:.1f}°", (330, 470),
                 cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255,255,255), 2)
-    
+
     # GPS display
     if gps_coords['lat'] and gps_coords['lon']:
-        cv2.putText(frame, f"GPS: {gps_coords['lat']:.4f}, {gps_coords['lon']:.4f}", 
+        cv2.putText(frame, f"GPS: {gps_coords['lat']:.4f}, {gps_coords['lon']:.4f}",
                     (10, 450), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0,255,0), 1)
-    
+
     # Alcohol test overlay
     if alcohol_test_active:
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (50, 100), (590, 350), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
-        
+        # Darken the panel region in place - equivalent to the old
+        # full-frame copy + black rectangle + addWeighted blend
+        frame[100:350, 50:590] //= 3
+
         cv2.putText(frame, "ALCOHOL DETECTED!", (120, 150),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0,0,255), 3)
         cv2.putText(frame, "Read this text aloud:", (100, 200),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255,255,255), 2)
-        
+
         # Display test text (split into lines if needed)
         words = test_text.split()
         line1 = ' '.join(words[:2])
@@ -512,10 +875,10 @@ while True:
                     cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0,255,255), 2)
         cv2.putText(frame, line2, (150, 290),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0,255,255), 2)
-        
+
         cv2.putText(frame, "Press 's' to start speaking", (120, 330),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255,255,255), 2)
-    
+
     # Accident detected overlay
     if accident_detected:
         cv2.putText(frame, "ACCIDENT DETECTED!", (150, 250),
@@ -523,22 +886,32 @@ while True:
         cv2.putText(frame, f"Tilt: {tilt_angle:.1f} degrees", (180, 300),
                     cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0,0,255), 2)
 
-    cv2.imshow("Advanced Safety System - Pi 5", frame)
-    
+    # Refresh the window at most ~30 Hz; imshow + waitKey cost a few ms
+    # each on the Pi. pollKey avoids waitKey's internal sleep on the
+    # iterations in between.
+    now = time.monotonic()
+    if now - last_show >= UI_REFRESH_INTERVAL:
+        cv2.imshow("Advanced Safety System - Pi 5", frame)
+        last_show = now
+        key = (cv2.pollKey() if HAVE_POLLKEY else cv2.waitKey(1)) & 0xFF
+    elif HAVE_POLLKEY:
+        key = cv2.pollKey() & 0xFF
+    else:
+        key = 255  # no keypress; waitKey only runs on display iterations
+
     # -------------------------
     # Keyboard controls
     # -------------------------
-    key = cv2.waitKey(1) & 0xFF
-    
+
     if key == ord("q"):
         print("\n-> Shutting down system...")
         break
-    
+
     elif key == ord("s") and alcohol_test_active:
         # Start speech verification
         print("\n🎤 Starting speech verification...")
         speech_correct = verify_speech(test_text)
-        
+
         if speech_correct:
             print("✓ Sobriety test PASSED")
             alcohol_test_active = False
@@ -549,7 +922,7 @@ while True:
             activate_external_buzzer()
             send_emergency_email("ALCOHOL DETECTED - Failed Sobriety Test", gps_coords)
             alcohol_test_active = False
-    
+
     elif key == ord("a"):
         # Manual alcohol test trigger
         print("\n🧪 Manual alcohol sensor test")
@@ -557,7 +930,7 @@ while True:
             print("⚠️ Alcohol detected!")
         else:
             print("✓ No alcohol detected")
-    
+
     elif key == ord("r"):
         # Reset accident detection
         accident_detected = False
@@ -568,6 +941,9 @@ while True:
 # -------------------------
 # Cleanup
 # -------------------------
+stop_event.set()
+capture_thread.join(timeout=1)
+detection_thread.join(timeout=1)
 stop_beep_alert()
 if buzzer_active:
     deactivate_external_buzzer()
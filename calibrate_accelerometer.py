@@ -37,15 +37,15 @@ print("This will establish the baseline readings.\n")
 input("Press Enter when ready...")
 
 print("\nCollecting 50 samples...")
-level_readings = []
+level_readings = np.empty((50, 3), dtype=np.float32)
 
 for i in range(50):
     axes = accel.get_axes(True)  # True for g-forces
-    level_readings.append([axes['x'], axes['y'], axes['z']])
+    level_readings[i] = (axes['x'], axes['y'], axes['z'])
     time.sleep(0.1)
 
-level_avg = np.mean(level_readings, axis=0)
-level_std = np.std(level_readings, axis=0)
+level_avg = level_readings.mean(axis=0)
+level_std = level_readings.std(axis=0)
 
 print(f"\n✓ Level Surface Results (in g):")
 print(f"  X-axis: {level_avg[0]:+.3f} ± {level_std[0]:.3f}")
@@ -70,14 +70,14 @@ print("You can use a protractor or phone app to verify angle.")
 input("\nPress Enter when tilted to 45°...")
 
 print("\nCollecting 30 samples...")
-tilt_45_readings = []
+tilt_45_readings = np.empty((30, 3), dtype=np.float32)
 
 for i in range(30):
     axes = accel.get_axes(True)
-    tilt_45_readings.append([axes['x'], axes['y'], axes['z']])
+    tilt_45_readings[i] = (axes['x'], axes['y'], axes['z'])
     time.sleep(0.1)
 
-tilt_45_avg = np.mean(tilt_45_readings, axis=0)
+tilt_45_avg = tilt_45_readings.mean(axis=0)
 
 # Calculate actual tilt angle
 x, y, z = tilt_45_avg
@@ -102,14 +102,14 @@ print("Tilt the device to approximately 60-70 degrees.")
 input("Press Enter when ready...")
 
 print("\nCollecting 30 samples...")
-extreme_readings = []
+extreme_readings = np.empty((30, 3), dtype=np.float32)
 
 for i in range(30):
     axes = accel.get_axes(True)
-    extreme_readings.append([axes['x'], axes['y'], axes['z']])
+    extreme_readings[i] = (axes['x'], axes['y'], axes['z'])
     time.sleep(0.1)
 
-extreme_avg = np.mean(extreme_readings, axis=0)
+extreme_avg = extreme_readings.mean(axis=0)
 x, y, z = extreme_avg
 magnitude = np.sqrt(x**2 + y**2 + z**2)
 extreme_angle = np.degrees(np.arccos(z / magnitude))
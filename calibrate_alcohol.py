@@ -6,7 +6,7 @@ Helps determine the appropriate threshold value for your sensor
 
 from gpiozero import MCP3008
 import time
-import statistics
+import numpy as np
 
 ALCOHOL_SENSOR_CHANNEL = 0  # MCP3008 channel
 SAMPLES = 100
@@ -35,24 +35,24 @@ print("="*60)
 print("Ensure there is NO alcohol in the environment.")
 input("Press Enter when ready...")
 
-clean_air_readings = []
+clean_air_readings = np.empty(SAMPLES, dtype=np.float32)
 print(f"\nCollecting {SAMPLES} samples...")
 
 for i in range(SAMPLES):
     value = alcohol_sensor.value * 1024  # Convert to ADC value (0-1023)
-    clean_air_readings.append(value)
+    clean_air_readings[i] = value
     if (i + 1) % 10 == 0:
         print(f"  Sample {i+1}/{SAMPLES}: {value:.1f}")
     time.sleep(SAMPLE_DELAY)
 
-clean_air_avg = statistics.mean(clean_air_readings)
-clean_air_std = statistics.stdev(clean_air_readings)
+clean_air_avg = clean_air_readings.mean()
+clean_air_std = clean_air_readings.std(ddof=1)
 
 print(f"\n✓ Clean Air Results:")
 print(f"  Average: {clean_air_avg:.2f}")
 print(f"  Std Dev: {clean_air_std:.2f}")
-print(f"  Min: {min(clean_air_readings):.2f}")
-print(f"  Max: {max(clean_air_readings):.2f}")
+print(f"  Min: {clean_air_readings.min():.2f}")
+print(f"  Max: {clean_air_readings.max():.2f}")
 
 print("\n" + "="*60)
 print("STEP 2: ALCOHOL PRESENCE TEST")
@@ -65,24 +65,24 @@ print("  - Alcoholic beverage vapor")
 print("\nWARNING: Do NOT expose sensor to open flame!")
 input("\nPress Enter when alcohol vapor is present...")
 
-alcohol_readings = []
+alcohol_readings = np.empty(SAMPLES, dtype=np.float32)
 print(f"\nCollecting {SAMPLES} samples with alcohol present...")
 
 for i in range(SAMPLES):
     value = alcohol_sensor.value * 1024
-    alcohol_readings.append(value)
+    alcohol_readings[i] = value
     if (i + 1) % 10 == 0:
         print(f"  Sample {i+1}/{SAMPLES}: {value:.1f}")
     time.sleep(SAMPLE_DELAY)
 
-alcohol_avg = statistics.mean(alcohol_readings)
-alcohol_std = statistics.stdev(alcohol_readings)
+alcohol_avg = alcohol_readings.mean()
+alcohol_std = alcohol_readings.std(ddof=1)
 
 print(f"\n✓ Alcohol Present Results:")
 print(f"  Average: {alcohol_avg:.2f}")
 print(f"  Std Dev: {alcohol_std:.2f}")
-print(f"  Min: {min(alcohol_readings):.2f}")
-print(f"  Max: {max(alcohol_readings):.2f}")
+print(f"  Min: {alcohol_readings.min():.2f}")
+print(f"  Max: {alcohol_readings.max():.2f}")
 
 print("\n" + "="*60)
 print("CALIBRATION RESULTS")
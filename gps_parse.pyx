@@ -0,0 +1,39 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+# Compiled version of the GGA field parser in test_gps.py. Built on
+# first import by pyximport, so no separate build step is needed on
+# the Pi - just `pip install cython` (a C compiler ships with
+# Raspberry Pi OS). test_gps.py falls back to the pure-Python parser
+# when this module can't be built.
+
+
+cpdef tuple parse_gpgga(str sentence):
+    """Parse a GGA sentence into (lat, lon, quality, satellites,
+    altitude), or None if malformed / no fix. The coordinate
+    arithmetic runs on typed C doubles instead of boxed floats."""
+    cdef double lat, lon
+    cdef list parts = sentence.split(',', 10)
+    if len(parts) < 10:
+        return None
+
+    cdef str lat_raw = parts[2]
+    cdef str ns = parts[3]
+    cdef str lon_raw = parts[4]
+    cdef str ew = parts[5]
+    cdef str quality = parts[6]
+    if (not lat_raw or not lon_raw or not quality.isdigit()
+            or ns not in ('N', 'S') or ew not in ('E', 'W')):
+        return None
+
+    try:
+        # ddmm.mmmm -> decimal degrees; 1/60 is constant-folded to a
+        # multiply at C level
+        lat = int(lat_raw[:2]) + float(lat_raw[2:]) * (1.0 / 60.0)
+        lon = int(lon_raw[:3]) + float(lon_raw[3:]) * (1.0 / 60.0)
+    except ValueError:
+        return None
+    if ns == 'S':
+        lat = -lat
+    if ew == 'W':
+        lon = -lon
+
+    return (lat, lon, quality, parts[7], parts[9])
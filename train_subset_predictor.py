@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Subset Shape Predictor Training Script
+Trains a 24-point (eyes + outer lips) landmark predictor from the
+iBUG 300-W dataset. EAR/MAR only use these 24 points, and predictor
+cost scales with landmark count, so the subset model is ~3x faster
+per frame than the full 68-point predictor.
+
+Dataset: http://dlib.net/files/data/ibug_300W_large_face_landmark_dataset.tar.gz
+Usage:   python train_subset_predictor.py [dataset_dir]
+"""
+
+import os
+import re
+import sys
+import dlib
+
+DATASET_DIR = sys.argv[1] if len(sys.argv) > 1 else "ibug_300W_large_face_landmark_dataset"
+OUTPUT_MODEL = "shape_predictor_eyes_mouth.dat"
+KEEP_PARTS = set(range(36, 60))  # eyes (36-47) + outer lips (48-59)
+
+print("="*60)
+print("SUBSET SHAPE PREDICTOR TRAINING")
+print("="*60)
+
+train_xml = os.path.join(DATASET_DIR, "labels_ibug_300W_train.xml")
+test_xml = os.path.join(DATASET_DIR, "labels_ibug_300W_test.xml")
+
+if not os.path.exists(train_xml):
+    print(f"✗ Dataset not found: {train_xml}")
+    print("\nDownload it with:")
+    print("  wget http://dlib.net/files/data/ibug_300W_large_face_landmark_dataset.tar.gz")
+    print("  tar xzf ibug_300W_large_face_landmark_dataset.tar.gz")
+    exit(1)
+
+_PART_RE = re.compile(r"<part name='(\d+)'")
+
+def filter_xml(src, dst):
+    """Write a copy of the labels file keeping only the eye/mouth parts"""
+    with open(src) as fin, open(dst, 'w') as fout:
+        for line in fin:
+            m = _PART_RE.search(line)
+            if m and int(m.group(1)) not in KEEP_PARTS:
+                continue
+            fout.write(line)
+
+print("\n-> Filtering landmark sets to eyes + outer lips (24 points)...")
+train_subset_xml = os.path.join(DATASET_DIR, "labels_eyes_mouth_train.xml")
+test_subset_xml = os.path.join(DATASET_DIR, "labels_eyes_mouth_test.xml")
+filter_xml(train_xml, train_subset_xml)
+filter_xml(test_xml, test_subset_xml)
+
+# Same settings as dlib's train_shape_predictor.py example
+options = dlib.shape_predictor_training_options()
+options.oversampling_amount = 300
+options.nu = 0.1
+options.tree_depth = 4
+options.num_threads = os.cpu_count() or 1
+options.be_verbose = True
+
+print("\n-> Training (this takes a while, even on a desktop)...")
+dlib.train_shape_predictor(train_subset_xml, OUTPUT_MODEL, options)
+
+print("\n-> Evaluating...")
+train_err = dlib.test_shape_predictor(train_subset_xml, OUTPUT_MODEL)
+test_err = dlib.test_shape_predictor(test_subset_xml, OUTPUT_MODEL)
+print(f"  Mean training error: {train_err:.4f}")
+print(f"  Mean testing error:  {test_err:.4f}")
+
+size_mb = os.path.getsize(OUTPUT_MODEL) / (1024 * 1024)
+print("\n" + "="*60)
+print("TRAINING COMPLETE")
+print("="*60)
+print(f"\n✓ Model written to {OUTPUT_MODEL} ({size_mb:.1f} MB)")
+print("\nCopy it next to advanced_safety_system.py and the system will")
+print("pick it up automatically (falls back to the 68-point model).")